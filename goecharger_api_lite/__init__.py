@@ -1 +1,11 @@
-from .goecharger_api_lite import GoeCharger  # noqa
\ No newline at end of file
+from .goecharger_api_lite import GoeCharger, Energy  # noqa
+
+
+def __getattr__(name):
+    # the asynchronous client is imported on first use only, so the synchronous API doesn't require aiohttp
+    # (pip install goecharger-api-lite[async])
+    if name in ("GoeChargerAsync", "poll_many"):
+        from . import goecharger_api_lite_async
+        return getattr(goecharger_api_lite_async, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
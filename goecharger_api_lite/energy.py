@@ -0,0 +1,82 @@
+"""
+Helpers for bulk processing of energy arrays ("nrg") collected from many status polls or chargers.
+
+Requires numpy (pip install goecharger-api-lite[numpy]).
+Uses numba for compiled kernels, if installed (pip install goecharger-api-lite[numba])
+"""
+from typing import Iterable, Sequence
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# number of values per energy array (any further values sent by the device are ignored)
+NRG_SIZE = 15
+
+# column indices of energy array
+NRG_VOLTAGE_L1, NRG_VOLTAGE_L2, NRG_VOLTAGE_L3, NRG_VOLTAGE_N = 0, 1, 2, 3
+NRG_CURRENT_L1, NRG_CURRENT_L2, NRG_CURRENT_L3 = 4, 5, 6
+NRG_POWER_L1, NRG_POWER_L2, NRG_POWER_L3, NRG_POWER_N, NRG_POWER_TOTAL = 7, 8, 9, 10, 11
+NRG_POWER_FACTOR_L1, NRG_POWER_FACTOR_L2, NRG_POWER_FACTOR_L3 = 12, 13, 14
+
+
+def nrg_to_array(nrg_list: Iterable[Sequence[float]]) -> np.ndarray:
+    """
+    Stacks raw energy arrays (e.g. GoeCharger.get_status_raw("nrg")["nrg"] of several polls) into one array
+
+    :param nrg_list: raw energy arrays, each containing at least NRG_SIZE values
+    :return: float64 array of shape (number of energy arrays, NRG_SIZE), values sent as None are NaN
+    """
+    rows = [nrg[:NRG_SIZE] for nrg in nrg_list]
+
+    if not rows:
+        return np.empty((0, NRG_SIZE))
+
+    # raises ValueError on energy arrays of different length
+    energy = np.array(rows, dtype=np.float64)
+
+    if energy.ndim != 2 or energy.shape[1] != NRG_SIZE:
+        raise ValueError(f"Energy arrays need to contain {NRG_SIZE} values, got shape {energy.shape}")
+
+    return energy
+
+
+def nrg_into(energy: np.ndarray, row: int, nrg: Sequence[float]) -> None:
+    """
+    Writes a raw energy array into a row of a preallocated array, e.g. for continuous polling into
+    energy = np.empty((number of polls, NRG_SIZE)) without allocating a new array per poll
+
+    :param energy: array of shape (number of rows, NRG_SIZE)
+    :param row: index of row to write
+    :param nrg: raw energy array (GoeCharger.get_status_raw("nrg")["nrg"])
+    """
+    energy[row] = nrg[:NRG_SIZE]
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _phase_totals(energy: np.ndarray) -> np.ndarray:
+        totals = np.zeros(3)
+
+        for row in range(energy.shape[0]):
+            totals[0] += energy[row, NRG_POWER_L1]
+            totals[1] += energy[row, NRG_POWER_L2]
+            totals[2] += energy[row, NRG_POWER_L3]
+
+        return totals
+else:
+    def _phase_totals(energy: np.ndarray) -> np.ndarray:
+        return energy[:, NRG_POWER_L1:NRG_POWER_L3 + 1].sum(axis=0)
+
+
+def phase_totals(energy: np.ndarray) -> np.ndarray:
+    """
+    Sums power per phase over all rows of an array created by nrg_to_array
+
+    :param energy: array of shape (number of energy arrays, NRG_SIZE)
+    :return: float64 array containing the summed power of L1, L2, L3
+    """
+    return _phase_totals(energy)
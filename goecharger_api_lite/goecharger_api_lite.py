@@ -1,15 +1,219 @@
-import asyncio
-import inspect
 import json
-from collections import OrderedDict
+import math
+import os
+import tempfile
+import time
+from collections import namedtuple
+from contextlib import contextmanager
 from enum import Enum
-from typing import Union, Tuple, Any, Dict, Optional, Coroutine
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
+from statistics import fmean
+from typing import Union, Tuple, Any, Dict, Optional, Callable, List, Iterator
+from urllib.parse import quote
 
-import aiohttp
-from aiohttp import ClientTimeout, ClientError, ContentTypeError
+import requests
+from requests import RequestException
+from requests.adapters import HTTPAdapter, Retry
 
 from goecharger_api_lite.exception import GoeChargerError
 
+# use orjson for (de)serialization if available (pip install goecharger-api-lite[fast])
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(value: Any) -> str:
+        return orjson.dumps(value).decode()
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(value: Any) -> str:
+        return json.dumps(value, separators=(',', ':'))
+
+
+def _parse_response(response_body: bytes) -> Any:
+    """
+    Parses JSON response of GoeCharger device
+    :param response_body: response body
+    :return: parsed response
+    """
+    try:
+        return _json_loads(response_body)
+    except ValueError as e:
+        raise GoeChargerError("Error parsing GoeCharger JSON data") from e
+
+
+# if set, responses to set requests are checked for the acknowledgement of each key ('"key":true')
+# without parsing them (they are only parsed, if an acknowledgement is missing)
+_FAST_SET_ACK = True
+
+
+def _set_ack(key: str) -> bytes:
+    """
+    Returns the acknowledgement of a successfully set key as contained in the raw response of GoeCharger device
+    :param key: key set
+    :return:
+    """
+    return b'"' + key.encode() + b'":true'
+
+
+def _encode_value(value: Any) -> str:
+    """
+    JSON encodes a value to be set on GoeCharger device.
+    Scalar values (int, bool, None, float) are encoded directly, without using the JSON encoder.
+    Raises a GoeChargerError on non-finite floats (NaN, Infinity)
+
+    :param value: value to encode
+    :return: JSON encoded value
+    """
+    value_type = type(value)
+
+    if value_type is int:
+        return str(value)
+
+    if value_type is bool:
+        return "true" if value else "false"
+
+    if value is None:
+        return "null"
+
+    # repr() of a finite float is valid JSON. NaN / Infinity aren't and would be encoded as null by orjson
+    if value_type is float:
+        if not math.isfinite(value):
+            raise GoeChargerError(f"Value '{value}' can't be set, needs to be a finite number")
+
+        return repr(value)
+
+    return _json_dumps(value)
+
+
+def _encode_query_value(value: Any) -> str:
+    """
+    JSON encodes and quotes a value to be set on GoeCharger device, to be used in a URL query
+    (e.g. for strings containing '&' or spaces). ',' and ':' are kept readable
+
+    :param value: value to encode
+    :return: JSON encoded and quoted value
+    """
+    return quote(_encode_value(value), safe=",:")
+
+
+@lru_cache(maxsize=32)
+def _build_status_url(host: str, status_type: str | Tuple[str, ...]) -> str:
+    """
+    Builds URL for a status request. Cached, as pollers request the same status types over and over
+
+    :param host: hostname of GoeCharger device
+    :param status_type: Single key name or tuple of key names to request (empty for full status)
+    :return: prepared URL
+    """
+    url = f"http://{host}/api/status"
+
+    if not status_type:
+        return url
+
+    return url + "?filter=" + (status_type if isinstance(status_type, str) else ",".join(status_type))
+
+
+# first 15 values of energy array "nrg" (any further values sent by the device are ignored)
+_energy_values = itemgetter(*range(15))
+
+# mappings of status values (dense integer values are tuples indexed by value)
+_CAR_STATES = (
+    "Unknown/Error",  # 0
+    "Idle",  # 1
+    "Charging",  # 2
+    "WaitCar",  # 3
+    "Complete",  # 4
+    "Error",  # 5
+)
+
+_ERRORS = (
+    None,  # 0
+    "FiAc",  # 1
+    "FiDc",  # 2
+    "Phase",  # 3
+    "Overvolt",  # 4
+    "Overamp",  # 5
+    "Diode",  # 6
+    "Ppinvalid",  # 7
+    "GndInvalid",  # 8
+    "ContactorStuck",  # 9
+    "ContactorMiss",  # 10
+    "FiUnknown",  # 11
+    "Unknown",  # 12
+    "Overtemp",  # 13
+    "NoComm",  # 14
+    "StatusLockStuckOpen",  # 15
+    "StatusLockStuckLocked",  # 16
+    "Undefined17",  # 17 (not defined)
+    "Undefined18",  # 18 (not defined)
+    "Undefined19",  # 19 (not defined)
+    "Reserved20",  # 20
+    "Reserved21",  # 21
+    "Reserved22",  # 22
+    "Reserved23",  # 23
+    "Reserved24",  # 24
+)
+
+_CHARGING_MODES = (
+    "neutral",  # 0
+    "off",  # 1
+    "on",  # 2
+)
+
+_PHASE_MODES = (
+    "auto",  # 0
+    "one",  # 1
+    "three",  # 2
+)
+
+_CABLE_LOCK_MODES = (
+    "unlock car first",  # 0
+    "automatic",  # 1
+    "locked",  # 2
+)
+
+
+def _dense_mapping(values: Tuple[Optional[str], ...]) -> Callable[[int], Optional[str]]:
+    """
+    Returns a function mapping a status value to its entry of a tuple indexed by value.
+    Like the dict mappings, it raises a KeyError on values without entry (negative values included)
+
+    :param values: mapped values, indexed by status value
+    :return: mapping function
+    """
+    count = len(values)
+
+    def map_value(value: int) -> Optional[str]:
+        if not 0 <= value < count:
+            raise KeyError(value)
+
+        return values[value]
+
+    return map_value
+
+
+# sparse values are mapped by dict
+_DEVICE_MODELS = {
+    11: "11KW/16A",
+    22: "22KW/32A"
+}
+
+# energy array "nrg" as returned by GoeCharger.get_energy()
+Energy = namedtuple("Energy", (
+    "voltage_l1", "voltage_l2", "voltage_l3", "voltage_n",
+    "current_l1", "current_l2", "current_l3",
+    "power_l1", "power_l2", "power_l3", "power_n", "power_total",
+    "power_factor_l1", "power_factor_l2", "power_factor_l3",
+))
+
 
 class GoeCharger:
     """
@@ -27,184 +231,153 @@ class GoeCharger:
         Internal class for mapping status to a more convenient format
         """
 
-        __mappings_car = {
-            0: "Unknown/Error",
-            1: "Idle",
-            2: "Charging",
-            3: "WaitCar",
-            4: "Complete",
-            5: "Error",
-        }
+        @staticmethod
+        def __map_energy(value: List[float]) -> Dict[str, Dict[str, float]]:
+            """
+            Maps the energy array into voltage / current / power / power factor per phase
+            """
+            (voltage_l1, voltage_l2, voltage_l3, voltage_n,
+             current_l1, current_l2, current_l3,
+             power_l1, power_l2, power_l3, power_n, power_total,
+             power_factor_l1, power_factor_l2, power_factor_l3) = _energy_values(value)
+
+            return {
+                "voltage": {
+                    "L1": voltage_l1,
+                    "L2": voltage_l2,
+                    "L3": voltage_l3,
+                    "N": voltage_n,
+                },
+                "current": {
+                    "L1": current_l1,
+                    "L2": current_l2,
+                    "L3": current_l3,
+                },
+                "power": {
+                    "L1": power_l1,
+                    "L2": power_l2,
+                    "L3": power_l3,
+                    "N": power_n,
+                    "total": power_total,
+                },
+                "power_factor": {
+                    "L1": power_factor_l1,
+                    "L2": power_factor_l2,
+                    "L3": power_factor_l3,
+                }
+            }
+
+        @staticmethod
+        def __map_temperature(value: List[float]) -> Optional[float]:
+            """
+            Maps the temperature array into its average temperature
+            """
+            count = len(value)
 
-        __mappings_err = {
-            0: None,
-            1: "FiAc",
-            2: "FiDc",
-            3: "Phase",
-            4: "Overvolt",
-            5: "Overamp",
-            6: "Diode",
-            7: "Ppinvalid",
-            8: "GndInvalid",
-            9: "ContactorStuck",
-            10: "ContactorMiss",
-            11: "FiUnknown",
-            12: "Unknown",
-            13: "Overtemp",
-            14: "NoComm",
-            15: "StatusLockStuckOpen",
-            16: "StatusLockStuckLocked",
-            20: "Reserved20",
-            21: "Reserved21",
-            22: "Reserved22",
-            23: "Reserved23",
-            24: "Reserved24"
-        }
+            if count == 0:
+                return None
 
-        __mappings_frc = {
-            0: "neutral",
-            1: "off",
-            2: "on"
-        }
+            # common case: device reports 2 temperature sensors
+            if count == 2:
+                first, second = value
+                return (first + second) * 0.5
 
-        __mappings_psm = {
-            0: "auto",
-            1: "one",
-            2: "three"
-        }
+            return fmean(value)
 
-        __mappings_ust = {
-            0 : "unlock car first",
-            1 : "automatic",
-            2 : "locked"
-        }
+        # key -> (mapped key, function mapping the value or None to return value unchanged)
+        __handlers: Dict[str, Tuple[str, Optional[Callable[[Any], Any]]]] = {
+            # ampere (currently possible rate)
+            "acu": ("ampere", None),
+
+            # ampere (device maximum)
+            "ama": ("ampere_device_maximum", None),
+
+            # ampere (allowed rate)
+            "amp": ("ampere_allowed", None),
+
+            # car state
+            "car": ("car_state", _dense_mapping(_CAR_STATES)),
+
+            "dwo": ("charge_limit", None),
 
-        __mappings_var = {
-            11: "11KW/16A",
-            22: "22KW/32A"
+            # error code
+            "err": ("error", _dense_mapping(_ERRORS)),
+
+            # forced state
+            "frc": ("charging_mode", _dense_mapping(_CHARGING_MODES)),
+
+            # energy array
+            "nrg": ("energy", __map_energy),
+
+            # phase_mode
+            "psm": ("phase_mode", _dense_mapping(_PHASE_MODES)),
+
+            # device temperature
+            "tma": ("temperature", __map_temperature),
+
+            # cable_lock_mode
+            "ust": ("cable_lock_mode", _dense_mapping(_CABLE_LOCK_MODES)),
+
+            # device model (11KW / 22KW)
+            "var": ("device_model", _DEVICE_MODELS.__getitem__),
         }
 
         def __init__(self, response: Dict[str, Any]):
             self.__response = response
 
-        def map_status_response(self) -> Dict[str, Any]:
+        def map_status_response(self, sort_keys: bool = False,
+                                into: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
             """
             Maps a dict containing a GoeCharger status response.
             Keys, for which a mapping isn't defined, are returned unchanged.
 
+            :param sort_keys: If set, the returned dict is ordered by keys (ascending)
+            :param into: If set, this dict is cleared and filled with the mapped key/value pairs (and returned)
             :return: Dict containing mapped key/value pairs
             """
-            mapped_response: Dict[str, Any] = {}
+            if into is None:
+                mapped_response: Dict[str, Any] = {}
+            else:
+                into.clear()
+                mapped_response = into
 
-            for item in self.__response.items():
-                mapped_name, mapped_value = self.__map_element(item)
-                mapped_response[mapped_name] = mapped_value
+            handlers = self.__handlers
 
-            return self.__order_dict(mapped_response)
+            for name, value in self.__response.items():
+                handler = handlers.get(name)
 
-        @classmethod
-        def __order_dict(cls, dict_to_order: Dict[Any, Any]) -> OrderedDict[Any, Any]:
-            """
-            Takes a dictionary and creates an OrderedDict ordered by keys (ascending)
-            :param dict_to_order:
-            :return: OrderedDict
-            """
-            ordered_dict = OrderedDict()
+                # no mapping specified, keep unchanged value
+                if handler is None:
+                    mapped_response[name] = value
+                    continue
+
+                mapped_name, map_value = handler
+                mapped_response[mapped_name] = value if map_value is None else map_value(value)
 
-            for key in sorted(dict_to_order.keys()):
-                ordered_dict[key] = dict_to_order[key]
+            if sort_keys:
+                sorted_items = sorted(mapped_response.items())
+                mapped_response.clear()
+                mapped_response.update(sorted_items)
 
-            return ordered_dict
+            return mapped_response
 
         @classmethod
-        def __map_element(cls, element: Tuple[str, Any]) -> Tuple[str, Any]:
+        def map_element(cls, name: str, value: Any) -> Tuple[str, Any]:
             """
-            Maps a single Tuple (key/value) into it's corresponding key/value format.
-            Returns a Tuple with unchanged key/value info, if no mapping is defined.
+            Maps a single key/value pair into its corresponding key/value format.
+            Returns key/value unchanged, if no mapping is defined.
 
-            :param element: Tuple to be mapped
-            :return:
+            :param name: key to be mapped
+            :param value: value to be mapped
+            :return: Tuple containing mapped key and value
             """
+            handler = cls.__handlers.get(name)
+
+            if handler is None:
+                return name, value
 
-            name = element[0]
-            value = element[1]
-
-            match name:
-
-                # ampere (currently possible rate)
-                case "acu":
-                    return "ampere", value
-
-                # ampere (device maximum)
-                case "ama":
-                    return "ampere_device_maximum", value
-
-                # ampere (allowed rate)
-                case "amp":
-                    return "ampere_allowed", value
-
-                # car state
-                case "car":
-                    return "car_state", cls.__mappings_car[value]
-
-                case "dwo":
-                    return "charge_limit", value
-
-                # error code
-                case "err":
-                    return "error", cls.__mappings_err[value]
-
-                # forced state
-                case "frc":
-                    return "charging_mode", cls.__mappings_frc[value]
-
-                # energy array
-                case "nrg":
-                    return "energy", {
-                        "voltage": {
-                            "L1": value[0],
-                            "L2": value[1],
-                            "L3": value[2],
-                            "N": value[3],
-                        },
-                        "current": {
-                            "L1": value[4],
-                            "L2": value[5],
-                            "L3": value[6],
-                        },
-                        "power": {
-                            "L1": value[7],
-                            "L2": value[8],
-                            "L3": value[9],
-                            "N": value[10],
-                            "total": value[11],
-                        },
-                        "power_factor": {
-                            "L1": value[12],
-                            "L2": value[13],
-                            "L3": value[14],
-                        }
-                    }
-
-                # phase_mode
-                case "psm":
-                    return "phase_mode", cls.__mappings_psm[value]
-
-                # device temperature
-                case "tma":
-                    return "temperature", sum(value)/len(value) if len(value) > 0 else None
-
-                # cable_lock_mode
-                case "ust":
-                    return "cable_lock_mode", cls.__mappings_ust[value]
-
-                # device model (11KW / 22KW)
-                case "var":
-                    return "device_model", cls.__mappings_var[value]
-
-                # no mapping specified, return unchanged value
-                case _:
-                    return name, value
+            mapped_name, map_value = handler
+            return mapped_name, value if map_value is None else map_value(value)
 
     # full status for all elements
     STATUS_FULL: Tuple = ()
@@ -251,12 +424,21 @@ class GoeCharger:
             automatic = 1
             locked = 2
 
-    def __init__(self, host: str, timeout: Optional[float] = 3.0) -> None:
+    def __init__(self, host: str, timeout: Optional[float] = 3.0, device_model: Optional[str] = None,
+                 status_cache_ttl: float = 0.0, session: Optional[requests.Session] = None) -> None:
         """
         Initialises GoeCharger connection
 
         :param host: hostname of GoeCharger device
-        :param timeout: timeout to wait for a response from device in seconds
+        :param timeout: timeout to wait for a response from device in seconds. Failed requests are retried twice
+            (if no session is passed), so a single call may block for about 3 times the timeout plus a short backoff
+        :param device_model: device model (e.g. "11KW/16A"), if known. Otherwise it is queried from device when needed
+            and cached in ~/.cache/goecharger. Updated, whenever a status sent by device contains a different model
+        :param status_cache_ttl: if set, get_status() returns a status cached for up to this many seconds, as long as
+            the car isn't charging and car state, error and charging mode didn't change. Only these are requested
+            from device in that case (see GoeCharger.STATUS_MINIMUM)
+        :param session: requests Session to use (e.g. shared by several devices, it isn't closed by close()).
+            If not set, an own session is created
         """
 
         if host is None or host == "":
@@ -265,37 +447,106 @@ class GoeCharger:
         self.__host = host
         self.__timeout = timeout
 
-        self.__device_model = ""
+        self.__device_model = device_model or self.__load_device_model()
 
-        self.__initialize_async_environment()
+        self.__set_url = f"http://{self.__host}/api/set?"
 
-    def __initialize_async_environment(self):
+        # keys collected by batch() (key -> (value, setting name)), None if no batch is active
+        self.__batch: Optional[Dict[str, Tuple[Any, Optional[str]]]] = None
+
+        # status type -> (time of request, status as sent by device)
+        self.__status_cache_ttl = status_cache_ttl
+        self.__status_cache: Dict[str | Tuple[str, ...], Tuple[float, Dict[str, Any]]] = {}
+
+        # the session keeps the connection to the device alive, so subsequent requests reuse the same socket
+        self.__owns_session = session is None
+
+        if session is None:
+            session = requests.Session()
+            session.mount(f"http://{self.__host}/", HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=4,
+                max_retries=Retry(total=2, backoff_factor=0.1)
+            ))
+
+        self.__session = session
+
+    def __del__(self):
         """
-        Internal method which brings preparations for async backend and HTTP requests in place
+        Housekeeping: Close HTTP session.
+        Best effort only (e.g. __init__ failed or interpreter is shutting down), use close() or a with-statement
         :return:
         """
+        try:
+            self.close()
+        except Exception:
+            pass
 
-        # save event loop for further usage with later async calls
-        self.__async_loop = asyncio.get_event_loop_policy().get_event_loop()
+    def __enter__(self) -> "GoeCharger":
+        return self
 
-        # prepare AIOHTTP client session (automatically uses the asyncio event loop of the current thread)
-        self.__aiohttp_client_session = aiohttp.ClientSession(timeout=ClientTimeout(total=self.__timeout))
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
 
-    def __run_async(self, coroutine: Coroutine) -> Any:
+    def close(self) -> None:
+        """
+        Closes the connection(s) to GoeCharger device (a session passed to __init__ is left open).
+        Can be used instead of a with-statement, e.g. `with GoeCharger(host) as charger:`
+        :return:
         """
-        Internal method to run a coroutine using the instance's async context
+        if self.__owns_session:
+            self.__session.close()
 
+    def __device_model_cache_file(self) -> Path:
+        """
+        Internal method returning the path of the file caching the device model of this host
         :return:
         """
-        return self.__async_loop.run_until_complete(coroutine)
+        return Path.home() / ".cache" / "goecharger" / f"{self.__host}.json"
 
-    def __del__(self):
+    def __load_device_model(self) -> str:
+        """
+        Internal method loading the device model cached for this host.
+        It's a hint only, replaced by the device model sent by device in any status containing it
+        :return: cached device model or empty string, if not cached (yet) or invalid
         """
-        Housekeeping: Close AIOHTTP client session
+        try:
+            device_model = json.loads(self.__device_model_cache_file().read_text())["device_model"]
+        except (OSError, RuntimeError, ValueError, KeyError, TypeError):
+            return ""
+
+        return device_model if isinstance(device_model, str) else ""
+
+    def __save_device_model(self) -> None:
+        """
+        Internal method caching the device model for this host (failures are ignored)
         :return:
         """
-        if self.__aiohttp_client_session:
-            self.__run_async(self.__aiohttp_client_session.close())
+        try:
+            cache_file = self.__device_model_cache_file()
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+            # write to a unique temporary file first, so other processes never read a partially written file
+            with tempfile.NamedTemporaryFile("w", dir=cache_file.parent, suffix=".tmp", delete=False) as temp_file:
+                temp_file.write(json.dumps({"device_model": self.__device_model}))
+
+            try:
+                os.replace(temp_file.name, cache_file)
+            except OSError:
+                os.unlink(temp_file.name)
+                raise
+        except (OSError, RuntimeError):
+            pass
+
+    def __get_device_model(self) -> str:
+        """
+        Internal method returning the device model. It's queried from device only, if it isn't known yet
+        :return:
+        """
+        if not self.__device_model:
+            self.__get_status_raw("var")
+
+        return self.__device_model
 
     def __create_status_request(self, filter_elements: Union[str, Tuple[str, ...]] | None = None) -> str:
         """
@@ -303,18 +554,11 @@ class GoeCharger:
         :param filter_elements: If set, only these keys are requested from GoeCharger device
         :return: prepared URL
         """
-        url = f"http://{self.__host}/api/status"
-
-        if filter_elements and len(filter_elements) > 0:
+        # single key (str) and tuples are used as cache key directly, other sequences are converted to tuple
+        if not isinstance(filter_elements, (str, tuple)):
+            filter_elements = tuple(filter_elements or ())
 
-            # convert str to tuple with 1 element
-            if type(filter_elements) is str:
-                filter_elements = (filter_elements, )
-
-            filter_url_appendix = "?filter=" + ",".join(filter_elements)
-            url += filter_url_appendix
-
-        return url
+        return _build_status_url(self.__host, filter_elements)
 
     def __create_key_set_request(self, key: str, value: Any) -> str:
         """
@@ -323,93 +567,247 @@ class GoeCharger:
         :param value: Value to set
         :return: prepared URL
         """
-        url = f"http://{self.__host}/api/set?{key}="
-
         # value has to be JSON encoded
-        value_json = json.dumps(value, separators=(',', ':'))
+        return self.__set_url + key + "=" + _encode_query_value(value)
 
-        return url + value_json
+    def __create_keys_set_request(self, pairs: Dict[str, Any]) -> str:
+        """
+        Creates URL for setting several keys at once
+        :param pairs: Keys and values to set
+        :return: prepared URL
+        """
+        return self.__set_url + "&".join(key + "=" + _encode_query_value(value) for key, value in pairs.items())
 
-    def __send_request(self, request: str, ignore_server_error: bool = False) -> Dict[str, Any]:
+    def __send_request_raw(self, request: str, ignore_server_error: bool = False) -> bytes:
         """
         Internal function for sending a prepared request (URL) to goeCharger device.
         Raises an GoeChargerError on any unexpected error or when local HTTP v2 API is not enabled on device
         :param request: request to be sent
         :param ignore_server_error: if set, don't raise a GoeChargerError on HTTP error 500 (useful when setting
                                      api keys)
-        :return:
+        :return: response body (not parsed)
         """
         try:
-            response = self.__run_async(self.__aiohttp_client_session.get(url=request))
+            response = self.__session.get(request, timeout=self.__timeout)
 
             # extra check for 404 error --> HTTP v2 API not enabled on device
-            if response.status == 404:
+            if response.status_code == 404:
                 raise GoeChargerError("HTTP API v2 not enabled on GoeCharger device. Please enable")
 
             # don't raise GoeChargerError on status_code 500, if so requested
-            if response.status != 500 and not ignore_server_error:
+            if response.status_code != 500 and not ignore_server_error:
                 response.raise_for_status()
 
-        except ClientError as e:
+        except RequestException as e:
             raise GoeChargerError("Error communicating with GoeCharger device") from e
 
-        try:
-            response_data = self.__run_async(response.json())
-        except ContentTypeError as e:
-            raise GoeChargerError("Error parsing GoeCharger JSON data") from e
+        return response.content
 
-        return response_data
+    def __send_request(self, request: str, ignore_server_error: bool = False) -> Dict[str, Any]:
+        """
+        Internal function for sending a prepared request (URL) to goeCharger device and parsing its JSON response.
+        Raises an GoeChargerError on any unexpected error or when local HTTP v2 API is not enabled on device
+        :param request: request to be sent
+        :param ignore_server_error: if set, don't raise a GoeChargerError on HTTP error 500 (useful when setting
+                                     api keys)
+        :return:
+        """
+        return _parse_response(self.__send_request_raw(request, ignore_server_error))
 
-    def __get_status(self, status_type: str | Tuple[str, ...]) -> Dict[str, Any]:
+    def __get_status(self, status_type: str | Tuple[str, ...], sort_keys: bool = False,
+                     into: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Internal method for getting status info from GoeCharger device
 
+        :param status_type: Single key name or tuple of key names to request from device.
+        :param sort_keys: If set, the returned dict is ordered by keys (ascending)
+        :param into: If set, this dict is cleared, filled with the status and returned
+        :return:
+        """
+        response = self.__get_status_raw(status_type)
+        return self._StatusMapper(response).map_status_response(sort_keys, into)
+
+    def __get_status_cached(self, status_type: str | Tuple[str, ...], sort_keys: bool = False,
+                            into: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Internal method for getting status info, using the cached status of an idle charger if possible.
+        Only status types containing car state, error and charging mode are cached
+
+        :param status_type: Single key name or tuple of key names to request from device.
+        :param sort_keys: If set, the returned dict is ordered by keys (ascending)
+        :param into: If set, this dict is cleared, filled with the status and returned
+        :return:
+        """
+        if status_type and not set(self.STATUS_MINIMUM).issubset(status_type):
+            return self.__get_status(status_type, sort_keys, into)
+
+        cache_key = status_type if isinstance(status_type, tuple) else tuple(status_type or ())
+        cached = self.__status_cache.get(cache_key)
+
+        # car not charging and cached status not expired: check whether state changed
+        if cached is not None and cached[1].get("car") != 2 \
+                and time.monotonic() - cached[0] < self.__status_cache_ttl:
+            cached_response = cached[1]
+            minimum_response = self.__get_status_raw(self.STATUS_MINIMUM)
+
+            if all(minimum_response.get(key) == cached_response.get(key) for key in self.STATUS_MINIMUM):
+                return self._StatusMapper(cached_response).map_status_response(sort_keys, into)
+
+        request_time = time.monotonic()
+        response = self.__get_status_raw(status_type)
+        self.__status_cache[cache_key] = (request_time, response)
+
+        return self._StatusMapper(response).map_status_response(sort_keys, into)
+
+    def __get_status_raw(self, status_type: str | Tuple[str, ...]) -> Dict[str, Any]:
+        """
+        Internal method for getting status info from GoeCharger device as sent by device (not mapped)
+
         :param status_type: Single key name or tuple of key names to request from device.
         :return:
         """
         response = self.__send_request(self.__create_status_request(status_type))
-        return self._StatusMapper(response).map_status_response()
 
-    def __set_key(self, key: str, value: Any) -> None:
+        # learn device model from any status containing it (e.g. STATUS_DEFAULT), so it never needs to be queried.
+        # A changed model (e.g. cached model of a replaced device) is updated as well
+        if "var" in response:
+            device_model = _DEVICE_MODELS.get(response["var"])
+
+            # unknown models aren't stored, a raw status must not fail because of the mapping table
+            if device_model is not None and device_model != self.__device_model:
+                self.__device_model = device_model
+                self.__save_device_model()
+
+        return response
+
+    def __get_one(self, key: str) -> Dict[str, Any]:
+        """
+        Internal method for getting a single key from GoeCharger device.
+        The key is mapped directly, without creating a status mapper for the response
+
+        :param key: key name to request from device
+        :return:
+        """
+        response = self.__get_status_raw(key)
+
+        if key not in response:
+            return {}
+
+        mapped_name, mapped_value = self._StatusMapper.map_element(key, response[key])
+        return {mapped_name: mapped_value}
+
+    def __set_key(self, key: str, value: Any, setting_name: Optional[str] = None) -> None:
         """
-        Internal method for setting keys on GoeCharger device
+        Internal method for setting keys on GoeCharger device.
+        Within batch(), the key is only collected and set when the batch is sent
 
         :param key: key to set
-        :param key: value for key to set
+        :param value: value for key to set
+        :param setting_name: name of setting used in error message (e.g. name of shortcut-method).
+            If not set, the name of key is used
         """
-        response = self.__send_request(self.__create_key_set_request(key, value), ignore_server_error=True)
+        if self.__batch is not None:
+            self.__batch[key] = (value, setting_name)
+            return
+
+        # any cached status may be outdated after setting a key
+        self.__status_cache.clear()
+
+        response_body = self.__send_request_raw(self.__create_key_set_request(key, value), ignore_server_error=True)
+
+        # common case: key acknowledged, no need to parse response
+        if _FAST_SET_ACK and _set_ack(key) in response_body:
+            return
+
+        response = _parse_response(response_body)
 
         if response is None or response.get(key) is not True:
-            stack_info = inspect.stack()
-            caller_method_name = stack_info[1][3]
+            raise GoeChargerError(f"Error setting '{setting_name or key}', got invalid response: '{response}'")
+
+    def __set_keys(self, pairs: Dict[str, Tuple[Any, Optional[str]]]) -> None:
+        """
+        Internal method for setting several keys on GoeCharger device using a single request
 
-            # call from generic set_key method: print name of key in Error
-            if caller_method_name == "set_key":
-                error_message_setting_name = key
+        :param pairs: key to set -> (value for key to set, name of setting used in error message or None)
+        """
+        if not pairs:
+            return
 
-            # call from a shortcut method: print name of shortcut-method in Error
-            else:
-                key_name = caller_method_name[4:]
-                error_message_setting_name = key_name
+        # any cached status may be outdated after setting a key
+        self.__status_cache.clear()
+
+        request = self.__create_keys_set_request({key: value for key, (value, _) in pairs.items()})
+        response_body = self.__send_request_raw(request, ignore_server_error=True)
+
+        # common case: all keys acknowledged, no need to parse response
+        if _FAST_SET_ACK and all(_set_ack(key) in response_body for key in pairs):
+            return
+
+        response = _parse_response(response_body)
 
-            raise GoeChargerError(f"Error setting '{error_message_setting_name}', got invalid response: '{response}'")
+        failed_settings = [
+            setting_name or key for key, (_, setting_name) in pairs.items()
+            if response is None or response.get(key) is not True
+        ]
 
-    def get_status(self, status_type: str | Tuple[str, ...] = STATUS_DEFAULT) -> Dict[str, Any]:
+        if failed_settings:
+            error_message_setting_names = "', '".join(failed_settings)
+            raise GoeChargerError(f"Error setting '{error_message_setting_names}', got invalid response: '{response}'")
+
+    def get_status(self, status_type: str | Tuple[str, ...] = STATUS_DEFAULT,
+                   sort_keys: bool = False, into: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Returns status of GoeCharger
+        :param status_type: Single key name or tuple of key names to request from device.
+            Several predefined Tuples are available as class variable.
+            If not set, GoeCharger.STATUS_DEFAULT is used as selection
+        :param sort_keys: If set, the returned dict is ordered by keys (ascending).
+            Otherwise keys are returned in the order sent by the device
+        :param into: If set, this dict is cleared, filled with the status and returned instead of a new dict
+            (e.g. to reuse one dict when polling frequently). Must not be shared between threads
+        :return:
+        """
+        if self.__status_cache_ttl:
+            return self.__get_status_cached(status_type, sort_keys, into)
+
+        return self.__get_status(status_type, sort_keys, into)
+
+    def get_status_raw(self, status_type: str | Tuple[str, ...] = STATUS_DEFAULT) -> Dict[str, Any]:
+        """
+        Returns status of GoeCharger as sent by device (keys and values are not mapped)
         :param status_type: Single key name or tuple of key names to request from device.
             Several predefined Tuples are available as class variable.
             If not set, GoeCharger.STATUS_DEFAULT is used as selection
         :return:
         """
-        return self.__get_status(status_type)
+        return self.__get_status_raw(status_type)
+
+    def get_values(self, keys: Tuple[str, ...]) -> Dict[str, Any]:
+        """
+        Returns mapped values for several keys using a single request to GoeCharger device.
+        Use this instead of several shortcut methods, e.g. get_values(("amp", "frc", "psm")) instead of
+        get_ampere(), get_charging_mode() and get_phase_mode()
+
+        :param keys: tuple of key names to request from device
+        :return:
+        """
+        return self.__get_status(keys)
+
+    def get_energy(self) -> Energy:
+        """
+        Returns energy data (voltage / current / power / power factor per phase) as named tuple,
+        e.g. get_energy().power_total.
+        Cheaper than the nested dict "energy" returned by get_status() when polling frequently
+        :return:
+        """
+        return Energy._make(_energy_values(self.__get_status_raw("nrg")["nrg"]))
 
     def get_ampere(self) -> Dict[str, int]:
         """
         Returns maximum current setting for car in Ampere
         :return:
         """
-        return self.__get_status("amp")
+        return self.__get_one("amp")
 
     def get_charging_mode(self) -> Dict[str, int]:
         """
@@ -417,34 +815,34 @@ class GoeCharger:
 
         :return:
         """
-        return self.__get_status("frc")
+        return self.__get_one("frc")
 
     def get_phase_mode(self) -> Dict[str, SettableValueEnum.PhaseMode]:
         """
         Returns phase mode of GoeCharger device (1 phase / 3 phases / neutral)
         """
-        return self.__get_status("psm")
+        return self.__get_one("psm")
 
     def get_absolute_max_current(self) -> Dict[str, int]:
         """
         Returns absolute maximum current setting for the device in Ampere
         :return:
         """
-        return self.__get_status("ama")
+        return self.__get_one("ama")
 
     def get_cable_lock_mode(self) -> Dict[str, SettableValueEnum.CableLockMode]:
         """
         Returns cable lock mode
         :return:
         """
-        return self.__get_status("ust")
+        return self.__get_one("ust")
 
     def get_charge_limit(self) -> Dict[str, float | None]:
         """
         Returns charge limit in Wh or null if disabled
         :return:
         """
-        return self.__get_status("dwo")
+        return self.__get_one("dwo")
 
     def set_key(self, key: str, value: Any) -> None:
         """
@@ -457,6 +855,46 @@ class GoeCharger:
         """
         self.__set_key(key, value)
 
+    def set_keys(self, **pairs: Any) -> None:
+        """
+        Generic (low-level) function for setting several GoeCharger keys using a single request,
+        e.g. set_keys(psm=2, amp=16)
+
+        :param pairs: names of keys to set and their values
+        :return:
+        """
+        if self.__batch is not None:
+            self.__batch.update((key, (value, None)) for key, value in pairs.items())
+            return
+
+        self.__set_keys({key: (value, None) for key, value in pairs.items()})
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Collects all keys set within the with-statement and sets them using a single request when it's left.
+        Nothing is set, if the with-statement is left by an exception
+
+        e.g.
+            with charger.batch():
+                charger.set_phase_mode(charger.SettableValueEnum.PhaseMode.three)
+                charger.set_ampere(16)
+        :return:
+        """
+
+        # nested batch: keys are set by outer batch
+        if self.__batch is not None:
+            yield
+            return
+
+        pairs = self.__batch = {}
+        try:
+            yield
+        finally:
+            self.__batch = None
+
+        self.__set_keys(pairs)
+
     def set_ampere(self, value: int | str) -> None:
         """
         Sets maximum current setting for car in Ampere
@@ -472,16 +910,15 @@ class GoeCharger:
             except ValueError:
                 raise GoeChargerError("Ampere value needs to be an integer")
 
-        if not self.__device_model:
-            self.__device_model = self.get_status("var")["device_model"]
+        device_model = self.__get_device_model()
 
         # check for 32A values on 16A devices
-        if self.__device_model.find("11") != -1 and value > 16:
+        if device_model.find("11") != -1 and value > 16:
             raise GoeChargerError(
-                f"Ampere value of '{value}' too big for charger device_model '{self.__device_model}'")
+                f"Ampere value of '{value}' too big for charger device_model '{device_model}'")
 
         # set value
-        self.__set_key("amp", value)
+        self.__set_key("amp", value, "ampere")
 
     def set_charging_mode(self, value: SettableValueEnum.ChargingMode) -> None:
         """
@@ -490,7 +927,7 @@ class GoeCharger:
         :param value: charging_mode to set
         :return:
         """
-        self.__set_key("frc", value.value)
+        self.__set_key("frc", value.value, "charging_mode")
 
     def set_phase_mode(self, value: SettableValueEnum.PhaseMode) -> None:
         """
@@ -499,7 +936,7 @@ class GoeCharger:
         :param value: phase mode to set
         :return:
         """
-        self.__set_key("psm", value.value)
+        self.__set_key("psm", value.value, "phase_mode")
 
     def set_absolute_max_current(self, value: int | str) -> None:
         """
@@ -516,16 +953,15 @@ class GoeCharger:
             except ValueError:
                 raise GoeChargerError("Ampere value needs to be an integer")
 
-        if not self.__device_model:
-            self.__device_model = self.get_status("var")["device_model"]
+        device_model = self.__get_device_model()
 
         # check for 32A values on 16A devices
-        if self.__device_model.find("11") != -1 and value > 16:
+        if device_model.find("11") != -1 and value > 16:
             raise GoeChargerError(
-                f"Ampere value of '{value}' too big for charger device_model '{self.__device_model}'")
+                f"Ampere value of '{value}' too big for charger device_model '{device_model}'")
 
         # set value
-        self.__set_key("ama", value)
+        self.__set_key("ama", value, "absolute_max_current")
 
     def set_cable_lock_mode(self, value: SettableValueEnum.CableLockMode) -> None:
         """
@@ -534,7 +970,7 @@ class GoeCharger:
         :param value: cable lock mode to set
         :return:
         """
-        self.__set_key("ust", value.value)
+        self.__set_key("ust", value.value, "cable_lock_mode")
 
     def set_charge_limit(self, chargeLimit: float | str | None) -> None:
         """
@@ -552,4 +988,4 @@ class GoeCharger:
                 except ValueError:
                     raise GoeChargerError("Wh needs to be an integer")
 
-        self.__set_key("dwo", chargeLimit)
+        self.__set_key("dwo", chargeLimit, "charge_limit")
@@ -0,0 +1,166 @@
+import asyncio
+from typing import Tuple, Any, Dict, Optional, List, Iterable, Union
+
+import aiohttp
+from aiohttp import ClientTimeout, ClientError
+
+from goecharger_api_lite.exception import GoeChargerError
+from goecharger_api_lite.goecharger_api_lite import (
+    GoeCharger, _parse_response, _encode_query_value, _build_status_url
+)
+
+
+class GoeChargerAsync:
+    """
+    Asynchronous communication class for go-eCharger EV wall boxes using local HTTP API v2.
+    Useful for polling several devices concurrently (see poll_many), e.g. sharing one aiohttp ClientSession
+
+    API documentation:
+    https://github.com/goecharger/go-eCharger-API-v2
+
+    Manufacturer:
+    https://go-e.com
+    """
+
+    STATUS_FULL = GoeCharger.STATUS_FULL
+    STATUS_MINIMUM = GoeCharger.STATUS_MINIMUM
+    STATUS_DEFAULT = GoeCharger.STATUS_DEFAULT
+
+    SettableValueEnum = GoeCharger.SettableValueEnum
+
+    def __init__(self, host: str, timeout: Optional[float] = 3.0,
+                 session: Optional[aiohttp.ClientSession] = None) -> None:
+        """
+        Initialises GoeCharger connection
+
+        :param host: hostname of GoeCharger device
+        :param timeout: timeout to wait for a response from device in seconds
+        :param session: aiohttp ClientSession to use (e.g. shared by several devices).
+            If not set, an own session is created on first request and closed by aclose()
+        """
+
+        if host is None or host == "":
+            raise ValueError("Host needs to be set")
+
+        self.__host = host
+        self.__timeout = ClientTimeout(total=timeout)
+
+        self.__set_url = f"http://{self.__host}/api/set?"
+
+        self.__session = session
+        self.__owns_session = session is None
+
+    async def __aenter__(self) -> "GoeChargerAsync":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Closes the AIOHTTP client session, if it was created by this instance
+        :return:
+        """
+        if self.__owns_session and self.__session is not None and not self.__session.closed:
+            await self.__session.close()
+
+    def __get_session(self) -> aiohttp.ClientSession:
+        """
+        Internal method returning the AIOHTTP client session.
+        An own session is created lazily, as it has to be created within a running event loop
+        :return:
+        """
+        if self.__session is None:
+            self.__session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=100, limit_per_host=4))
+
+        return self.__session
+
+    async def __send_request(self, request: str, ignore_server_error: bool = False) -> Dict[str, Any]:
+        """
+        Internal function for sending a prepared request (URL) to goeCharger device.
+        Raises an GoeChargerError on any unexpected error or when local HTTP v2 API is not enabled on device
+        :param request: request to be sent
+        :param ignore_server_error: if set, don't raise a GoeChargerError on HTTP error 500 (useful when setting
+                                     api keys)
+        :return:
+        """
+        try:
+            async with self.__get_session().get(request, timeout=self.__timeout) as response:
+
+                # extra check for 404 error --> HTTP v2 API not enabled on device
+                if response.status == 404:
+                    raise GoeChargerError("HTTP API v2 not enabled on GoeCharger device. Please enable")
+
+                # don't raise GoeChargerError on status_code 500, if so requested
+                if response.status != 500 and not ignore_server_error:
+                    response.raise_for_status()
+
+                response_body = await response.read()
+
+        except (ClientError, asyncio.TimeoutError) as e:
+            raise GoeChargerError("Error communicating with GoeCharger device") from e
+
+        return _parse_response(response_body)
+
+    async def get_status(self, status_type: str | Tuple[str, ...] = STATUS_DEFAULT,
+                         sort_keys: bool = False, into: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Returns status of GoeCharger
+        :param status_type: Single key name or tuple of key names to request from device.
+            Several predefined Tuples are available as class variable.
+            If not set, GoeCharger.STATUS_DEFAULT is used as selection
+        :param sort_keys: If set, the returned dict is ordered by keys (ascending).
+            Otherwise keys are returned in the order sent by the device
+        :param into: If set, this dict is cleared, filled with the status and returned instead of a new dict
+            (e.g. to reuse one dict when polling frequently). Must not be shared between concurrent requests
+        :return:
+        """
+        # other sequences (e.g. list) are converted to tuple, to be usable as cache key
+        if not isinstance(status_type, (str, tuple)):
+            status_type = tuple(status_type or ())
+
+        response = await self.__send_request(_build_status_url(self.__host, status_type))
+        return GoeCharger._StatusMapper(response).map_status_response(sort_keys, into)
+
+    async def set_key(self, key: str, value: Any) -> None:
+        """
+        Generic (low-level) function for setting a GoeCharger key to a value.
+        For possible keys see official API documentation for device
+
+        :param key: name of key to set
+        :param value: value for key to set
+        """
+        response = await self.__send_request(self.__set_url + key + "=" + _encode_query_value(value),
+                                             ignore_server_error=True)
+
+        if response is None or response.get(key) is not True:
+            raise GoeChargerError(f"Error setting '{key}', got invalid response: '{response}'")
+
+
+async def poll_many(chargers: Iterable[GoeChargerAsync],
+                    status_type: str | Tuple[str, ...] = GoeCharger.STATUS_DEFAULT,
+                    max_concurrency: Optional[int] = None,
+                    return_exceptions: bool = False) -> List[Union[Dict[str, Any], BaseException]]:
+    """
+    Requests status of several GoeCharger devices concurrently.
+    By default, the first failing device (e.g. unreachable) raises its GoeChargerError and the status of all other
+    devices is discarded
+
+    :param chargers: devices to poll
+    :param status_type: Single key name or tuple of key names to request from devices
+    :param max_concurrency: If set, maximum number of requests running at the same time
+    :param return_exceptions: If set, the exception of a failing device is returned in place of its status,
+        instead of being raised
+    :return: list of status dicts (same order as chargers), or exceptions of failing devices if return_exceptions
+    """
+    if max_concurrency is None:
+        return list(await asyncio.gather(*(charger.get_status(status_type) for charger in chargers),
+                                         return_exceptions=return_exceptions))
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def poll(charger: GoeChargerAsync) -> Dict[str, Any]:
+        async with semaphore:
+            return await charger.get_status(status_type)
+
+    return list(await asyncio.gather(*(poll(charger) for charger in chargers), return_exceptions=return_exceptions))
@@ -25,7 +25,12 @@ setup(
     keywords="go-e EV wallbox electric charger Gemini flex HOMEfix HOME+ HTTP API v2",
     python_requires='>=3.10',
     install_requires=[
-        'aiohttp',
-        'aiodns',
-    ]
+        'requests',
+    ],
+    extras_require={
+        'async': ['aiohttp', 'aiodns'],
+        'fast': ['orjson'],
+        'numpy': ['numpy'],
+        'numba': ['numpy', 'numba'],
+    }
 )